@@ -43,13 +43,17 @@ class Toggle(Enum):
     @property
     def state(self) -> bool:
         """Return state of checkable krita action called `action_name`."""
-        return Api.instance().action(self.value).isChecked()
+        return _KRITA.action(self.value).isChecked()
 
     @state.setter
     def state(self, state: bool) -> None:
         """Set state of checkable krita action (toggle) by its enum."""
-        return Api.instance().action(self.value).setChecked(state)
+        return _KRITA.action(self.value).setChecked(state)
 
     def switch_state(self) -> None:
         """Change state from ON to OFF and vice-versa."""
         self.state = not self.state
+
+
+_KRITA = Api.instance()
+"""Krita singleton, used to find the checkable actions."""
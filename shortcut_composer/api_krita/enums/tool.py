@@ -102,7 +102,7 @@ class Tool(Enum):
     POLYGONAL_SELECTION = "KisToolSelectPolygonal"
 
     def activate(self):
-        Api.instance().action(self.value).trigger()
+        _KRITA.action(self.value).trigger()
 
     @staticmethod
     def is_paintable(tool: 'Tool') -> bool:
@@ -113,7 +113,7 @@ class Tool(Enum):
     def icon(self) -> QIcon:
         """Return the icon of this tool."""
         icon_name = _ICON_NAME_MAP.get(self, "edit-delete")
-        return Api.instance().icon(icon_name)
+        return _KRITA.icon(icon_name)
 
     def __eq__(self, other) -> bool:
         """All subtools of transform tool are technically the same tool."""
@@ -126,7 +126,7 @@ class Tool(Enum):
         return hash(self.value)
 
 
-_TRANSFORMS = {
+_TRANSFORMS = frozenset({
     Tool.TRANSFORM,
     Tool.TRANSFORM_FREE,
     Tool.TRANSFORM_PERSPECTIVE,
@@ -134,10 +134,10 @@ _TRANSFORMS = {
     Tool.TRANSFORM_CAGE,
     Tool.TRANSFORM_LIQUIFY,
     Tool.TRANSFORM_MESH,
-}
+})
 """Set of all subtools that are in fact the transform tool."""
 
-_PAINTABLE = {
+_PAINTABLE = frozenset({
     Tool.FREEHAND_BRUSH,
     Tool.LINE,
     Tool.ELLIPSE,
@@ -145,7 +145,7 @@ _PAINTABLE = {
     Tool.RECTANGLE,
     Tool.MULTI_BRUSH,
     Tool.POLYLINE,
-}
+})
 """Set of tools that are used to paint on the canvas."""
 
 _ICON_NAME_MAP = {
@@ -191,3 +191,6 @@ _ICON_NAME_MAP = {
     Tool.POLYGONAL_SELECTION: "tool_polygonal_selection"
 }
 """Maps tools to names of their icons."""
+
+_KRITA = Api.instance()
+"""Krita singleton, used to find tool actions and icons."""
@@ -4,9 +4,15 @@
 import math
 from typing import Optional
 
-from PyQt5.QtGui import QPainter, QPainterPath, QColor, QPixmap, QPaintEvent
+from PyQt5.QtGui import (
+    QPainterPath,
+    QPaintDevice,
+    QPaintEvent,
+    QPainter,
+    QPixmap,
+    QColor,
+)
 from PyQt5.QtCore import QPoint, QRectF
-from PyQt5.QtWidgets import QWidget
 
 
 class Painter:
@@ -17,13 +23,22 @@ class Painter:
     - wheel of given thickness, color and radius
     - pie being a part of a wheel
     - pixmap providing a center instead of top-left corner
+    - pixmap covering the whole device
+
+    Paints on a widget during its paint event, or on any other paint
+    device (like a pixmap) when the event is not given.
 
     Unlike original painter, can be used with context manager.
     """
 
-    def __init__(self, widget: QWidget, event: QPaintEvent) -> None:
-        self._painter = QPainter(widget)
-        self._painter.eraseRect(event.rect())
+    def __init__(
+        self,
+        device: QPaintDevice,
+        event: Optional[QPaintEvent] = None
+    ) -> None:
+        self._painter = QPainter(device)
+        if event is not None:
+            self._painter.eraseRect(event.rect())
         self._painter.setRenderHints(QPainter.Antialiasing)
 
     def paint_wheel(
@@ -78,12 +93,16 @@ class Painter:
             pixmap
         )
 
+    def paint_layer(self, pixmap: QPixmap) -> None:
+        """Paint pixmap of the device size, respecting its pixel ratio."""
+        self._painter.drawPixmap(0, 0, pixmap)
+
     def _square(self, center: QPoint, width: int) -> QRectF:
         """Return a square of given `width` at `center` point."""
         return QRectF(center.x()-width//2, center.y()-width//2, width, width)
 
     def end(self) -> None:
-        """End painting a widget provided in __init__."""
+        """End painting a device provided in __init__."""
         self._painter.end()
 
     def __enter__(self) -> 'Painter':
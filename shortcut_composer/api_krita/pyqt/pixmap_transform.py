@@ -33,11 +33,20 @@ class PixmapTransform:
         return QPixmap.fromImage(out_img)
 
     @staticmethod
-    def scale_pixmap(pixmap: QPixmap, size_px: int) -> QPixmap:
-        """Scale a square pixmal to new size."""
+    def scale_pixmap(
+        pixmap: QPixmap,
+        size_px: int,
+        aspect_mode: Qt.AspectRatioMode = Qt.KeepAspectRatio,
+    ) -> QPixmap:
+        """
+        Scale a pixmap to fit in a square of new size.
+
+        With `Qt.KeepAspectRatioByExpanding` the pixmap covers the square
+        instead, which allows to crop it to circle without empty space.
+        """
         return pixmap.scaled(
             size_px,
             size_px,
-            Qt.KeepAspectRatio,
+            aspect_mode,
             Qt.SmoothTransformation
         )
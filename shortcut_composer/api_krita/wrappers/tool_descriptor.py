@@ -1,6 +1,8 @@
 # SPDX-FileCopyrightText: © 2022 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from typing import Iterator, Optional
+
 from krita import Krita as Api
 from PyQt5.QtWidgets import QWidget, QToolButton
 
@@ -37,20 +39,44 @@ class ToolDescriptor:
         return Tool(current_tool_name)
 
     class ToolFinder:
-        """Helper class for finding currently active tool."""
+        """
+        Helper class for finding currently active tool.
+
+        Name of the active tool is remembered until one of the toolbox
+        buttons gets toggled, so that the toolbox is not scanned again
+        each time the tool is read.
+        """
 
         def __init__(self) -> None:
             """Remember the reference to toolbox krita object."""
             self.instance = Api.instance()
             self.toolbox = self._init_toolbox()
+            self._active_tool_name: Optional[str] = None
+            for button in self._iterate_tool_buttons():
+                button.toggled.connect(self._forget_active_tool_name)
 
         def find_active_tool_name(self) -> str:
+            """Return name of currently active tool."""
+            if self._active_tool_name is None:
+                self._active_tool_name = self._scan_active_tool_name()
+            return self._active_tool_name
+
+        def _scan_active_tool_name(self) -> str:
             """Find and return name of currently active tool."""
+            for button in self._iterate_tool_buttons():
+                if button.isChecked():
+                    return button.objectName()
+            raise RuntimeError("No active tool found.")
+
+        def _forget_active_tool_name(self, *_) -> None:
+            """Make the next read scan the toolbox, as the tool changed."""
+            self._active_tool_name = None
+
+        def _iterate_tool_buttons(self) -> Iterator[QToolButton]:
+            """Yield toolbox buttons which represent the tools."""
             for qobj in self.toolbox.findChildren(QToolButton):
                 if qobj.metaObject().className() == "KoToolBoxButton":
-                    if qobj.isChecked():
-                        return qobj.objectName()
-            raise RuntimeError("No active tool found.")
+                    yield qobj
 
         def _init_toolbox(self) -> QWidget:
             """Find and return reference to unwrapped toolbox object."""
@@ -1,7 +1,7 @@
 # SPDX-FileCopyrightText: © 2022 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from typing import Union, Any
+from typing import Union, Any, Dict
 from enum import Enum
 
 from api_krita import Krita
@@ -29,6 +29,9 @@ class Config(Enum):
     - read current value from krita config file
     - write given value to krita config file
 
+    Values read from krita are cached in memory, as they can only
+    change by writing them using this class.
+
     Class holds a staticmethod which resets all config files.
     """
 
@@ -50,15 +53,18 @@ class Config(Enum):
         return _defaults[self]
 
     def read(self) -> Any:
-        """Read current value from krita config file."""
-        return type(self.default)(Krita.read_setting(
-            group="ShortcutComposer",
-            name=self.value,
-            default=str(self.default),
-        ))
+        """Read current value from krita config file, or from cache."""
+        if self not in _cache:
+            _cache[self] = type(self.default)(Krita.read_setting(
+                group="ShortcutComposer",
+                name=self.value,
+                default=str(self.default),
+            ))
+        return _cache[self]
 
     def write(self, value: Any) -> None:
-        """Write given value to krita config file."""
+        """Write given value to krita config file and invalidate cache."""
+        _cache.pop(self, None)
         Krita.write_setting(
             group="ShortcutComposer",
             name=self.value,
@@ -92,3 +98,6 @@ _defaults = {
     Config.TAG_BLUE: "Erasers",
 }
 """Maps default values to config fields."""
+
+_cache: Dict[Config, Any] = {}
+"""Maps config fields to values already read from krita config file."""
@@ -15,10 +15,16 @@ from .settings_dialog_utils import (
 
 
 class SettingsDialog(QDialog):
-    """Dialog which allows to change global settings of the plugin."""
+    """
+    Dialog which allows to change global settings of the plugin.
+
+    Applying the changes reloads the plugin only when any of the values
+    was changed, either in the dialog elements, or by resetting them.
+    """
 
     def __init__(self) -> None:
         super().__init__()
+        self._needs_reload = False
 
         self.setMinimumSize(QSize(300, 200))
         self.setWindowTitle("Configure Shortcut Composer")
@@ -39,10 +45,15 @@ class SettingsDialog(QDialog):
         self.setLayout(full_layout)
 
     def _apply(self) -> None:
-        """Ask all dialog zones to apply themselves."""
-        self._combo_boxes_layout.apply()
-        self._spin_boxes_layout.apply()
-        Krita.trigger_action("Reload Shortcut Composer")
+        """Ask all dialog zones to apply themselves. Reload if needed."""
+        if self._combo_boxes_layout.apply():
+            self._needs_reload = True
+        if self._spin_boxes_layout.apply():
+            self._needs_reload = True
+
+        if self._needs_reload:
+            self._needs_reload = False
+            Krita.trigger_action("Reload Shortcut Composer")
 
     def _refresh(self) -> None:
         """Ask all dialog zones to refresh themselves. """
@@ -57,6 +68,7 @@ class SettingsDialog(QDialog):
     def _reset(self) -> None:
         """Reset all config values to defaults in krita and elements."""
         Config.reset_defaults()
+        self._needs_reload = True
         self._refresh()
 
     def show(self) -> None:
@@ -52,14 +52,26 @@ class ComboBoxesLayout(QGridLayout):
     def refresh(self) -> None:
         """Read list of tags and set it to all stored comboboxes."""
         with Database() as database:
-            tags = database.get_brush_tags()
+            tags = sorted(database.get_brush_tags(), key=str.lower)
 
         for config, combo_box in self._combo_boxes.items():
+            combo_box.setUpdatesEnabled(False)
+            combo_box.blockSignals(True)
             combo_box.clear()
-            combo_box.addItems(sorted(tags, key=str.lower))
+            combo_box.addItems(tags)
             combo_box.setCurrentText(config.read())
+            combo_box.blockSignals(False)
+            combo_box.setUpdatesEnabled(True)
 
-    def apply(self) -> None:
-        """Write values from all stored comboboxes to krita config file."""
+    def apply(self) -> bool:
+        """
+        Write changed values from stored comboboxes to krita config file.
+
+        Return whether any of the values was changed.
+        """
+        changed = False
         for config, combo in self._combo_boxes.items():
-            config.write(combo.currentText())
+            if combo.currentText() != config.read():
+                config.write(combo.currentText())
+                changed = True
+        return changed
@@ -115,7 +115,15 @@ class SpinBoxesLayout(QFormLayout):
         for config, form in self._forms.items():
             form.setValue(config.read())  # type: ignore
 
-    def apply(self) -> None:
-        """Write values from stored spin boxes to krita config file."""
+    def apply(self) -> bool:
+        """
+        Write changed values from stored spin boxes to krita config file.
+
+        Return whether any of the values was changed.
+        """
+        changed = False
         for config, form in self._forms.items():
-            config.write(form.value())
+            if form.value() != config.read():
+                config.write(form.value())
+                changed = True
+        return changed
@@ -65,6 +65,7 @@ class UndoController(Controller):
     - Setting a value smaller than currently remembered performs `undo`
     - Setting a value greater than currently remembered performs `redo`
     - Each Undo and redo change remembered position by 1
+    - Undo and redo are repeated until the given position is reached
     """
 
     state = 0
@@ -77,11 +78,9 @@ class UndoController(Controller):
         """Compares value with remembered position and performs undo/redo."""
         value = round(value)
 
-        if value == self.state:
-            return
-        elif value > self.state:
+        while value > self.state:
             Krita.trigger_action("edit_redo")
             self.state += 1
-        else:
+        while value < self.state:
             Krita.trigger_action("edit_undo")
             self.state -= 1
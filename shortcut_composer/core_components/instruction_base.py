@@ -1,7 +1,7 @@
 # SPDX-FileCopyrightText: © 2022 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from typing import List
+from typing import Callable, Dict, List
 from functools import partialmethod
 
 
@@ -25,15 +25,23 @@ class InstructionHolder:
 
     Has the same interface as Instruction. Each method runs the
     respective method in every stored Instruction.
+
+    Methods of stored instructions are bound on the first event of each
+    kind, so that handling further key events does not look them up.
     """
 
     def __init__(self, instructions: List[Instruction] = []) -> None:
         self._instructions = instructions
+        self._bound_methods: Dict[str, List[Callable[[], None]]] = {}
 
     def _template(self, method_name: str) -> None:
         """Perform method `method_name` of each held instruction."""
-        for instruction in self._instructions:
-            getattr(instruction, method_name)()
+        if method_name not in self._bound_methods:
+            self._bound_methods[method_name] = [
+                getattr(instruction, method_name)
+                for instruction in self._instructions]
+        for method in self._bound_methods[method_name]:
+            method()
 
     on_key_press = partialmethod(_template, "on_key_press")
     on_short_key_release = partialmethod(_template, "on_short_key_release")
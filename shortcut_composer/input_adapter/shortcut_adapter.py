@@ -9,6 +9,18 @@ from api_krita import Krita
 from .complex_action import ComplexAction
 
 
+def _key_sequence_from_event(event: QKeyEvent) -> QKeySequence:
+    """Return key sequence representing the key and modifiers of event."""
+    return QKeySequence(event.modifiers() | event.key())  # type: ignore
+
+
+def _match_shortcuts(_a: QKeySequence, _b: QKeySequence, /) -> bool:
+    """Custom match pattern - one string is preset in another one."""
+    parsed_a = _a.toString()
+    parsed_b = _b.toString()
+    return parsed_a in parsed_b or parsed_b in parsed_a
+
+
 class ShortcutAdapter:
     """
     Adds additional key events based on krita's key press and release.
@@ -48,8 +60,8 @@ class ShortcutAdapter:
         """Decide if the key release event is matches shortcut and is valid."""
         return (not release_event.isAutoRepeat()
                 and not self.key_released
-                and self._match_shortcuts(
-                    self._key_sequence_from_event(release_event),
+                and _match_shortcuts(
+                    _key_sequence_from_event(release_event),
                     self.tool_shortcut))
 
     def event_filter_callback(self, release_event: QKeyEvent) -> None:
@@ -66,14 +78,3 @@ class ShortcutAdapter:
     def tool_shortcut(self) -> QKeySequence:
         """Return shortcut assigned to shortcut red from krita settings."""
         return Krita.get_action_shortcut(self.action.name)
-
-    @staticmethod
-    def _key_sequence_from_event(event: QKeyEvent):
-        return QKeySequence(event.modifiers() | event.key())  # type: ignore
-
-    @staticmethod
-    def _match_shortcuts(_a: QKeySequence, _b: QKeySequence, /) -> bool:
-        """Custom match pattern - one string is preset in another one."""
-        parsed_a = _a.toString()
-        parsed_b = _b.toString()
-        return parsed_a in parsed_b or parsed_b in parsed_a
@@ -29,31 +29,43 @@ class MouseInterpreter:
     value points to the range limit.
     """
 
+    __slots__ = (
+        "mouse_origin",
+        "start_value",
+        "min",
+        "max",
+        "pixels_in_unit",
+        "_units_in_pixel",
+    )
+
     mouse_origin: MouseInput
     start_value: Interpreted
     min: Interpreted
     max: Interpreted
     pixels_in_unit: int
 
+    def __post_init__(self) -> None:
+        """Store inverted sensitivity, to multiply by it on each mouse."""
+        self._units_in_pixel = 1/self.pixels_in_unit
+
     def interpret(self, mouse: MouseInput) -> Interpreted:
         """Return value corresponding to the `mouse`."""
         mouse_delta = MouseInput(mouse - self.mouse_origin)
-        value_delta = self.mouse_to_value(mouse_delta)
-        raw_value = Interpreted(self.start_value + value_delta)
-        self._recalibrate_if_needed(raw_value)
-        return self._clip(raw_value)
-
-    def _recalibrate_if_needed(self, value: Interpreted) -> None:
-        """If interpreted value, exceeds the range limit, recalibrate."""
-        if (middle := self._clip(value)) == value:
-            return
-        value_delta = Interpreted(middle - value)
+        raw_value = Interpreted(
+            self.start_value + self.mouse_to_value(mouse_delta))
+        clipped_value = self._clip(raw_value)
+        if clipped_value != raw_value:
+            self._recalibrate(Interpreted(clipped_value - raw_value))
+        return clipped_value
+
+    def _recalibrate(self, value_delta: Interpreted) -> None:
+        """Move `mouse_origin` to make current mouse point to the limit."""
         mouse_delta = self.value_to_mouse(value_delta)
         self.mouse_origin = MouseInput(self.mouse_origin - mouse_delta)
 
     def mouse_to_value(self, mouse: MouseInput) -> Interpreted:
         """Translate the mouse offset to value offset."""
-        return Interpreted(mouse/self.pixels_in_unit)
+        return Interpreted(mouse*self._units_in_pixel)
 
     def value_to_mouse(self, value: Interpreted) -> MouseInput:
         """Translate the value offset to mouse offset."""
@@ -61,4 +73,4 @@ class MouseInterpreter:
 
     def _clip(self, value: Interpreted) -> Interpreted:
         """Clip the value to limit range."""
-        return sorted((self.min, value, self.max))[1]
+        return Interpreted(min(self.max, max(self.min, value)))
@@ -1,7 +1,7 @@
 # SPDX-FileCopyrightText: © 2022 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from typing import Callable, Iterable
+from typing import Callable, Iterable, Optional
 
 from api_krita import Krita
 from api_krita.pyqt import Timer
@@ -42,7 +42,8 @@ class SliderHandler:
     - the mouse offset is being interpreted
     - interpreted values allow to fetch controller compatibile values
       from the `SliderValues`
-    - `SliderValues` values are being set using the controller.
+    - `SliderValues` values are being set using the controller, but
+      only when the mouse points to a different value than before.
 
     Calling stop cancels the process at any step, including deadzone
     phase in which case main loop will never be started.
@@ -65,6 +66,7 @@ class SliderHandler:
         self._mouse_getter: MouseGetter
         self._start_point: MouseInput
         self._interpreter: MouseInterpreter
+        self._last_snapped: Optional[Interpreted]
 
     def start(self) -> None:
         """Start a deadzone phase in a timer."""
@@ -93,13 +95,22 @@ class SliderHandler:
         self._main_timer.start()
 
     def _value_setting_loop(self) -> None:
-        """Set current value from `SliderValues`."""
+        """
+        Set current value from `SliderValues` if mouse points to a new one.
+
+        Mouse positions are compared in the `SliderValues` domain, as
+        different controller values can be equal to each other.
+        """
         clipped_value = self._interpreter.interpret(self.read_mouse())
-        to_set = self._to_cycle.at(clipped_value)
-        self._slider.controller.set_value(to_set)
+        snapped_value = self._to_cycle.snap(clipped_value)
+        if snapped_value == self._last_snapped:
+            return
+        self._last_snapped = snapped_value
+        self._slider.controller.set_value(self._to_cycle.at(snapped_value))
 
     def _update_interpreter(self) -> None:
         """Store a new interpreter with current mouse and current value."""
+        self._last_snapped = None
         self._interpreter = MouseInterpreter(
             min=self._to_cycle.min,
             max=self._to_cycle.max,
@@ -125,7 +136,7 @@ class SliderHandler:
         """
         cursor = Krita.get_cursor()
         if self._is_horizontal:
-            return lambda: MouseInput(cursor.x())
+            return cursor.x  # type: ignore
         return lambda: MouseInput(-cursor.y())
 
     @staticmethod
@@ -1,8 +1,7 @@
 # SPDX-FileCopyrightText: © 2022 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from typing import Any, List, Generic, TypeVar
-from abc import ABC, abstractmethod
+from typing import Any, List, Generic, Protocol, TypeVar
 
 from data_components import Range
 from .new_types import Interpreted
@@ -11,59 +10,63 @@ Controlled = TypeVar("Controlled")
 """Value compatibile with handled controller."""
 
 
-class SliderValues(ABC, Generic[Controlled]):
+class SliderValues(Protocol[Controlled]):
     """
     Converts between interpreted values and those compatibile with controller.
 
     Works as if it was a container with  controller compatibile values:
     - `at()` fetches controller value using interpreted value
     - `index()` fetches interpreted value using controller value
+    - `snap()` tells which interpreted value `at()` would really use, so
+      values that give the same controller value snap to the same one
 
-    Valid interpreted values are a contiguous range - each child of this
-    class must contain public attributes:
+    Valid interpreted values are a contiguous range - each implementation
+    of this protocol must provide public attributes:
     - `min` - first valid interpreted value (range beginning)
     - `max` - last valid interpreted value (range end)
     """
 
-    min: Interpreted
-    max: Interpreted
+    @property
+    def min(self) -> Interpreted: """First valid interpreted value."""
+    @property
+    def max(self) -> Interpreted: """Last valid interpreted value."""
 
-    @abstractmethod
     def at(self, value: Interpreted) -> Controlled:
         """Return controller compatibile value based on interpreted value."""
 
-    @abstractmethod
     def index(self, value: Controlled) -> Interpreted:
         """Return first occurance of controlled value."""
 
+    def snap(self, value: Interpreted) -> Interpreted:
+        """Return interpreted value which is used to fetch the element."""
+
 
-class RangeSliderValues(SliderValues):
+class RangeSliderValues:
     """
     Allows to fetch values from Range object defined by the user.
 
     Moving from interpreted to controller domain require no calculation,
-    apart from restricting it to the range `min` and `max` values.
+    apart from clipping it to the range `min` and `max` values.
     """
 
     def __init__(self, values: Range) -> None:
         self.min = Interpreted(values.min)
         self.max = Interpreted(values.max)
-        self._default = Interpreted((self.min + self.max)*0.5)
 
     def at(self, value: Interpreted) -> float:
-        """Check if element belongs to the range, and return it as is."""
-        if not self.min <= value <= self.max:
-            return self._default
-        return value
+        """Return the element clipped to the range."""
+        return min(self.max, max(self.min, value))
 
     def index(self, value: float) -> Interpreted:
-        """Check if element belongs to the range, and return it as is."""
-        if not self.min <= value <= self.max:
-            return self._default
-        return Interpreted(value)
+        """Return the element clipped to the range."""
+        return Interpreted(min(self.max, max(self.min, value)))
 
+    def snap(self, value: Interpreted) -> Interpreted:
+        """Return the value clipped to the range."""
+        return Interpreted(min(self.max, max(self.min, value)))
 
-class ListSliderValues(SliderValues, Generic[Controlled]):
+
+class ListSliderValues(Generic[Controlled]):
     """
     Allows to fetch values from list or other class with similar interface.
 
@@ -92,15 +95,19 @@ class ListSliderValues(SliderValues, Generic[Controlled]):
 
         For values from outside the range, use the right range limit.
         """
-        if not self.min <= value <= self.max:
-            value = Interpreted(sorted((self.min, value, self.max))[1])
-        return self._values[round(value)]
+        return self._values[round(self.snap(value))]
 
     def index(self, value: Controlled) -> Interpreted:
         """Return index of list element directly from it."""
-        if value not in self._values:
+        try:
+            return Interpreted(self._values.index(value))
+        except ValueError:
             value = self._handle_nonpresent_element(value)
-        return Interpreted(self._values.index(value))
+            return Interpreted(self._values.index(value))
+
+    def snap(self, value: Interpreted) -> Interpreted:
+        """Return index of list element which the value points to."""
+        return Interpreted(round(min(self.max, max(self.min, value))))
 
     def _handle_nonpresent_element(self, value: Controlled) -> Controlled:
         """
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import math
+from functools import lru_cache
 from typing import Iterable, Tuple
 
 from PyQt5.QtCore import QPoint
@@ -21,6 +22,8 @@ class CirclePoints:
     - iterate over points, when the circle is divided into even parts
     """
 
+    __slots__ = ("_center", "_radius")
+
     def __init__(self, center: QPoint, radius: int):
         self._center = center
         self._radius = radius
@@ -48,12 +51,24 @@ class CirclePoints:
 
     def iterate_over_circle(self, amount: int) -> Iterable[Tuple[int, QPoint]]:
         """Iterate over points, when the circle is divided into even parts."""
-        for angle in self._float_range(0, 360, 360/amount):
-            yield round(angle), self.point_from_angle(angle)
-
-    @staticmethod
-    def _float_range(start: float, end: float, step: float) -> Iterable[float]:
-        """Implementation of range() which supports `step` being float."""
-        while start < end:
-            yield start
-            start += step
+        return iter(_divide_circle(
+            self._center.x(),
+            self._center.y(),
+            self._radius,
+            amount))
+
+
+@lru_cache(maxsize=None)
+def _divide_circle(x: int, y: int, radius: int, amount: int) \
+        -> Tuple[Tuple[int, QPoint], ...]:
+    """
+    Return angles and points of circle divided into `amount` even parts.
+
+    Angles are computed from integer indices to avoid accumulating the
+    floating point error. Result is cached, as the same circles are
+    divided each time the plugin gets reloaded.
+    """
+    circle = CirclePoints(QPoint(x, y), radius)
+    angles = (index*360/amount for index in range(amount))
+    return tuple((round(angle), circle.point_from_angle(angle))
+                 for angle in angles)
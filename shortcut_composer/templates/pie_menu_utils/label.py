@@ -100,10 +100,9 @@ class TextLabelPainter(LabelPainter):
         label.setGeometry(0, 0, round(heigth*2), round(heigth))
         label.move(self.label.center.x()-heigth,
                    self.label.center.y()-heigth//2)
-        label.setStyleSheet(f'''
-            background-color:rgba({self._color_to_str(self.style.icon_color)});
-            color:rgba({self._color_to_str(to_display.color)});
-        ''')
+        label.setStyleSheet(
+            self.style.icon_background_css
+            + f"color:rgba({self._color_to_str(to_display.color)});")
 
         label.show()
         return label
@@ -144,17 +143,23 @@ class ImageLabelPainter(LabelPainter):
         painter.paint_pixmap(self.label.center, self.ready_image)
 
     def _prepare_image(self) -> QPixmap:
-        """Return image after scaling and reshaping it to circle."""
+        """
+        Return image after scaling and reshaping it to circle.
+
+        Scaling is done first, so that the image is reshaped in its
+        final size, instead of the usually much bigger original one.
+        """
         to_display = self.label.display_value
 
         if not isinstance(to_display, QPixmap):
             raise TypeError("Label supposed to be QPixmap.")
 
-        rounded_image = PixmapTransform.make_pixmap_round(to_display)
-        return PixmapTransform.scale_pixmap(
-            pixmap=rounded_image,
-            size_px=round(self.style.icon_radius*1.8)
+        scaled_image = PixmapTransform.scale_pixmap(
+            pixmap=to_display,
+            size_px=round(self.style.icon_radius*1.8),
+            aspect_mode=Qt.KeepAspectRatioByExpanding,
         )
+        return PixmapTransform.make_pixmap_round(scaled_image)
 
 
 class IconPainter(ImageLabelPainter):
@@ -1,7 +1,7 @@
 # SPDX-FileCopyrightText: © 2022 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from typing import Dict, Iterator, Optional
+from typing import Dict, Iterator, List, Optional
 
 from .label import Label
 
@@ -13,16 +13,21 @@ class LabelHolder:
     Allows one of the labels to be active, but does not handle this
     attribute by itself.
 
+    Closest labels for each of 360 integer angles are calculated once,
+    on first fetch after adding labels, and stored in a lookup table.
+
     Allows iterating over Labels (default) and over angles (angles())
     """
 
     def __init__(self):
         self._labels: Dict[int, Label] = {}
+        self._angle_table: List[Label] = []
         self.active: Optional[Label] = None
 
     def add(self, label: Label) -> None:
         """Add a new label to the holder."""
         self._labels[label.angle] = label
+        self._angle_table.clear()
 
     def angles(self) -> Iterator[int]:
         """Iterate over all angles of held Labels."""
@@ -30,10 +35,16 @@ class LabelHolder:
 
     def from_angle(self, angle: int) -> Label:
         """Return Label which is the closest to given `angle`."""
+        if not self._angle_table:
+            self._angle_table = [self._find_closest(table_angle)
+                                 for table_angle in range(360)]
+        return self._angle_table[angle % 360]
+
+    def _find_closest(self, angle: int) -> Label:
+        """Search for Label which is the closest to given `angle`."""
 
         def angle_difference(label_angle: int):
             """Return the smallest difference between two angles."""
-            nonlocal angle
             raw_difference = label_angle - angle
             return abs((raw_difference + 180) % 360 - 180)
 
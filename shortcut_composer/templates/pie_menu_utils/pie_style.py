@@ -5,6 +5,7 @@ import math
 import platform
 from typing import Optional
 from dataclasses import dataclass
+from functools import cached_property
 from copy import copy
 
 from PyQt5.QtGui import QColor
@@ -83,6 +84,13 @@ class PieStyle:
         max_icon_size = round(self.pie_radius * math.pi / amount)
         self.icon_radius = min(self.icon_radius, max_icon_size)
 
+    @cached_property
+    def icon_background_css(self) -> str:
+        """Return stylesheet rule painting a label background in icon color."""
+        color = self.icon_color
+        return (f"background-color:rgba({color.red()}, {color.green()}, "
+                f"{color.blue()}, {color.alpha()});")
+
     def _pick_background_color(self, color: Optional[QColor]) -> QColor:
         if color is not None:
             return color
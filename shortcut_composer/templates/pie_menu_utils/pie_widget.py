@@ -1,10 +1,10 @@
 # SPDX-FileCopyrightText: © 2022 Wojciech Trybus <wojtryb@gmail.com>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from typing import List
+from typing import Callable, List, Optional
 
 from PyQt5.QtCore import Qt, QPoint
-from PyQt5.QtGui import QColor, QPaintEvent
+from PyQt5.QtGui import QColor, QPaintEvent, QPixmap
 
 from api_krita.pyqt import AnimatedWidget, Painter
 from composer_utils import Config
@@ -20,11 +20,13 @@ class PieWidget(AnimatedWidget):
     Methods inherits from QWidget used by other components:
     - show() - displays the widget
     - hide() - hides the widget
-    - repaint() - updates widget display after its data was changed
+    - update() - schedules a repaint after its data was changed
 
     Overrides paintEvent(QPaintEvent) which tells how the widget looks
 
     - Paints the widget: its base, and active pie and deadzone indicator
+    - Elements that do not depend on active label are painted once to
+      the cached pixmaps, so that hovering repaints only the active pie
     - Wraps Labels with LabelPainter which activated, paint them
     - Extends widget interface to allow moving the widget on screen by
       providing the widget center.
@@ -40,6 +42,11 @@ class PieWidget(AnimatedWidget):
         self.labels = labels
         self._style = style
         self._label_painters = self._create_label_painters()
+        self._pie_span = 360//len(self.labels) if self.labels else 360
+
+        self._layers_ratio: Optional[float] = None
+        self._background_layer: QPixmap
+        self._foreground_layer: QPixmap
 
         self.setWindowFlags((
             self.windowFlags() |  # type: ignore
@@ -52,11 +59,14 @@ class PieWidget(AnimatedWidget):
 
         size = self._style.widget_radius*2
         self.setGeometry(0, 0, size, size)
+        self._center = QPoint(
+            self._style.widget_radius,
+            self._style.widget_radius)
 
     @property
     def center(self) -> QPoint:
         """Return point with center widget's point in its coordinates."""
-        return QPoint(self._style.widget_radius, self._style.widget_radius)
+        return self._center
 
     @property
     def center_global(self) -> QPoint:
@@ -74,21 +84,43 @@ class PieWidget(AnimatedWidget):
 
     def paintEvent(self, event: QPaintEvent) -> None:
         """Paint the entire widget using the Painter wrapper."""
+        if self._layers_ratio != self.devicePixelRatioF():
+            self._create_layers()
+
         with Painter(self, event) as painter:
-            self._paint_deadzone_indicator(painter)
-            self._paint_base_wheel(painter)
+            painter.paint_layer(self._background_layer)
             self._paint_active_pie(painter)
-            self._paint_base_border(painter)
+            painter.paint_layer(self._foreground_layer)
+
+    def _create_layers(self) -> None:
+        """Paint static elements below and above the active pie to pixmaps."""
+        self._layers_ratio = self.devicePixelRatioF()
+        self._background_layer = self._paint_to_pixmap(
+            self._paint_deadzone_indicator,
+            self._paint_base_wheel,
+        )
+        self._foreground_layer = self._paint_to_pixmap(
+            self._paint_base_border,
+            *(label_painter.paint for label_painter in self._label_painters),
+        )
 
-            for label_painter in self._label_painters:
-                label_painter.paint(painter)
+    def _paint_to_pixmap(self, *paint_methods: Callable[[Painter], None]) \
+            -> QPixmap:
+        """Return transparent pixmap of widget size with elements painted."""
+        pixmap = QPixmap(self.size() * self._layers_ratio)
+        pixmap.setDevicePixelRatio(self._layers_ratio)
+        pixmap.fill(Qt.transparent)
+        with Painter(pixmap) as painter:
+            for paint_method in paint_methods:
+                paint_method(painter)
+        return pixmap
 
     def _paint_base_wheel(self, painter: Painter) -> None:
         """Paint a base circle and low opacity background to trick Windows."""
         painter.paint_wheel(
             center=self.center,
             outer_radius=self._style.no_border_radius,
-            color=QColor(128, 128, 128, 1),
+            color=_WINDOWS_TRICK_COLOR,
         )
         painter.paint_wheel(
             center=self.center,
@@ -114,13 +146,13 @@ class PieWidget(AnimatedWidget):
         painter.paint_wheel(
             center=self.center,
             outer_radius=self.deadzone,
-            color=QColor(128, 255, 128, 120),
+            color=_DEADZONE_OUTER_COLOR,
             thickness=1,
         )
         painter.paint_wheel(
             center=self.center,
             outer_radius=self.deadzone-1,
-            color=QColor(255, 128, 128, 120),
+            color=_DEADZONE_INNER_COLOR,
             thickness=1,
         )
 
@@ -133,7 +165,7 @@ class PieWidget(AnimatedWidget):
             center=self.center,
             outer_radius=self._style.no_border_radius,
             angle=self.labels.active.angle,
-            span=360//len(self._label_painters),
+            span=self._pie_span,
             color=self._style.active_color,
             thickness=self._style.area_thickness,
         )
@@ -141,3 +173,13 @@ class PieWidget(AnimatedWidget):
     def _create_label_painters(self) -> List[LabelPainter]:
         """Wrap all labels with LabelPainter which can paint it."""
         return [label.get_painter(self, self._style) for label in self.labels]
+
+
+_WINDOWS_TRICK_COLOR = QColor(128, 128, 128, 1)
+"""Almost transparent color of base circle, which makes Windows see it."""
+
+_DEADZONE_OUTER_COLOR = QColor(128, 255, 128, 120)
+"""Color of the outer line of deadzone indicator."""
+
+_DEADZONE_INNER_COLOR = QColor(255, 128, 128, 120)
+"""Color of the inner line of deadzone indicator."""